@@ -3,17 +3,43 @@ from __future__ import annotations
 import os
 
 from dataclasses import dataclass, field, fields
-from typing import Annotated, Optional
+from typing import Annotated, ClassVar, Dict, FrozenSet, Optional
 
 from langchain_core.runnables import RunnableConfig, ensure_config
 
 from react_agent import prompts
 
 
-@dataclass(kw_only=True)
+def _read_meteor_env(prefix: str) -> Dict[str, Optional[str]]:
+    """Read the Meteor connection env variables for a prefix."""
+    return {
+        "meteor_url": os.environ.get(f"{prefix}_METEOR_URL"),
+        "meteor_user_name": os.environ.get(f"{prefix}_METEOR_USERNAME"),
+        "meteor_user_password": os.environ.get(f"{prefix}_METEOR_PASSWORD"),
+    }
+
+
+# Meteor env variables per prefix, read once instead of on every Configuration
+_METEOR_ENV: Dict[str, Dict[str, Optional[str]]] = {
+    prefix: _read_meteor_env(prefix)
+    for prefix in ("DEFAULT", *filter(None, os.environ.get("METEOR_PREFIXES", "").split(",")))
+}
+
+
+def _meteor_env(prefix: str) -> Dict[str, Optional[str]]:
+    """Get the cached Meteor env variables for a prefix, reading them on first use."""
+    env = _METEOR_ENV.get(prefix)
+    if env is None:
+        env = _METEOR_ENV[prefix] = _read_meteor_env(prefix)
+    return env
+
+
+@dataclass(kw_only=True, slots=True)
 class Configuration:
     """The configuration for the agent."""
 
+    _INIT_FIELDS: ClassVar[FrozenSet[str]]
+
     reasoner_prompt: str = field(
         default=prompts.REASONER_PROMPT,
         metadata={
@@ -49,10 +75,26 @@ class Configuration:
     )
 
     # Meteor configuration
-    meteor_url: str = os.environ.get("DEFAULT_METEOR_URL") or "ws://127.0.0.1:3000/websocket"
-    meteor_user_name: str = os.environ.get("DEFAULT_METEOR_USERNAME") or "fnord"
-    meteor_user_password: str = os.environ.get("DEFAULT_METEOR_PASSWORD") or "fnord"
+    meteor_url: str = _METEOR_ENV["DEFAULT"]["meteor_url"] or "ws://127.0.0.1:3000/websocket"
+    meteor_user_name: str = _METEOR_ENV["DEFAULT"]["meteor_user_name"] or "fnord"
+    meteor_user_password: str = _METEOR_ENV["DEFAULT"]["meteor_user_password"] or "fnord"
     
+    meteor_keep_alive: bool = field(
+        default=True,
+        metadata={
+            "description": "Whether to keep Meteor connections open between tool calls. "
+            "When disabled, every call connects, logs in and closes its connection."
+        },
+    )
+
+    meteor_call_timeout: float = field(
+        default=30.0,
+        metadata={
+            "description": "Seconds to wait for the reply to a Meteor method call. "
+            "A call without a reply in time fails; the connection stays open for other calls."
+        },
+    )
+
     meteor_prefix: str = field(
         default='DEFAULT',
         metadata={
@@ -69,5 +111,17 @@ class Configuration:
         """Create a Configuration instance from a RunnableConfig object."""
         config = ensure_config(config)
         configurable = config.get("configurable") or {}
-        _fields = {f.name for f in fields(cls) if f.init}
-        return cls(**{k: v for k, v in configurable.items() if k in _fields})
+        kwargs = {k: configurable[k] for k in cls._INIT_FIELDS.intersection(configurable)}
+
+        # A non-default prefix selects the Meteor connection from its env variables,
+        # unless the values are configured explicitly
+        prefix = kwargs.get("meteor_prefix")
+        if prefix and prefix != "DEFAULT":
+            for name, value in _meteor_env(prefix).items():
+                if value is not None:
+                    kwargs.setdefault(name, value)
+
+        return cls(**kwargs)
+
+
+Configuration._INIT_FIELDS = frozenset(f.name for f in fields(Configuration) if f.init)
@@ -3,8 +3,9 @@
 Works with a chat model with tool calling support.
 """
 
+import functools
 from datetime import datetime, timezone
-from typing import Dict, List, Literal, cast
+from typing import Dict, List, Literal, Tuple, cast
 
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from langchain_core.runnables import RunnableConfig
@@ -17,6 +18,23 @@ from react_agent.tools import TOOLS
 from react_agent.utils import load_chat_model
 
 
+@functools.lru_cache(maxsize=8)
+def _format_prompt(template: str, system_time: str) -> str:
+    """Format a system prompt template, reusing the result within the same second."""
+    return template.format(system_time=system_time)
+
+
+@functools.lru_cache(maxsize=4)
+def _bound_model(model_name: str):
+    """Load the chat model with TOOLS bound, once per model name."""
+    return load_chat_model(model_name).bind_tools(TOOLS, tool_choice="any")
+
+
+def _system_time() -> str:
+    """Get the current UTC time as an ISO string truncated to the second."""
+    return datetime.now(tz=timezone.utc).replace(microsecond=0).isoformat()
+
+
 async def reasoner(
     state: State, config: RunnableConfig
 ) -> Dict[str, List[AIMessage]]:
@@ -27,12 +45,10 @@ async def reasoner(
     # provider = configuration.model.split('/')[0].lower() if '/' in configuration.model else ""
 
     # Initialize the model with tool binding
-    model = load_chat_model(configuration.model).bind_tools(TOOLS, tool_choice="any")
+    model = _bound_model(configuration.model)
 
     # Format the system prompt
-    system_message = configuration.reasoner_prompt.format(
-        system_time=datetime.now(tz=timezone.utc).isoformat()
-    )
+    system_message = _format_prompt(configuration.reasoner_prompt, _system_time())
 
     # Get the model's response
     response = cast(
@@ -67,9 +83,7 @@ async def final_response(
     model = load_chat_model(configuration.model)
 
     # Use the final response specific prompt
-    system_message = configuration.final_response_prompt.format(
-        system_time=datetime.now(tz=timezone.utc).isoformat()
-    )
+    system_message = _format_prompt(configuration.final_response_prompt, _system_time())
 
     # Generate the final response
     response = cast(
@@ -97,24 +111,27 @@ async def reasoner_talkback(state: State, config: RunnableConfig) -> Dict[str, L
 
 
 
+# Next node keyed by (is_last_step, has_tool_calls)
+_REASONER_ROUTES: Dict[Tuple[bool, bool], Literal["tools", "reasoner_talkback", "final_response"]] = {
+    # On the last step without tool calls, go straight to final_response
+    (True, False): "final_response",
+    # Without tool calls before the last step, remind the reasoner to use tools
+    (False, False): "reasoner_talkback",
+    # Otherwise, use tools
+    (True, True): "tools",
+    (False, True): "tools",
+}
+
+
 def route_after_reasoner(state: State) -> Literal["tools", "reasoner_talkback", "final_response"]:
     """Determine the next node based on the model's output."""
     last_message = state.messages[-1]
-    if not isinstance(last_message, AIMessage):
+    if __debug__ and not isinstance(last_message, AIMessage):
         raise ValueError(
             f"Expected AIMessage in output edges, but got {type(last_message).__name__}"
 )
 
-    # If this is the last step and there are no tool calls, go straight to final_response
-    if state.is_last_step and not last_message.tool_calls:
-        return "final_response"
-
-    # If there are no tool calls but not the last step, go to reasoner_talkback
-    if not last_message.tool_calls:
-        return "reasoner_talkback"
-
-    # Otherwise, use tools
-    return "tools"
+    return _REASONER_ROUTES[(bool(state.is_last_step), bool(last_message.tool_calls))]
 
 
 def route_after_tools(state: State) -> Literal["reasoner", "final_response"]:
@@ -7,104 +7,222 @@ that interact with Meteor methods.
 """
 
 import asyncio
+import atexit
 import json
-from typing import Any, Callable, Dict, List, Union, Optional
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, Union, Optional
 from typing_extensions import Annotated
 
+import fastjsonschema
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import InjectedToolArg
-from MeteorClient import MeteorClient
 
 from react_agent.configuration import Configuration
+from src.utilities.json_schema import format_schema
 
+if TYPE_CHECKING:
+    from MeteorClient import MeteorClient
 
-class MeteorClientManager:
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+
+# Connected, logged-in clients shared by every tool, keyed by (meteor_url, username)
+_CLIENT_POOL: Dict[Tuple[str, str], "MeteorClient"] = {}
+_POOL_LOCK = asyncio.Lock()
+
+# MeteorClient pulls in the websocket and DDP stack, so it is imported on first use
+_MeteorClient = None
+
+
+def _meteor_client_class() -> type:
     """
-    A singleton manager for maintaining a persistent Meteor client connection.
+    Import the MeteorClient class on first use.
     """
-    _instance = None
-    _client = None
-    _endpoint = None  # Add this to store the current endpoint URL
-    _is_connected = False
-    _is_logged_in = False
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(MeteorClientManager, cls).__new__(cls)
-        return cls._instance
-    
-    def get_client(self, meteor_url: str, username: Optional[str] = None, password: Optional[str] = None) -> MeteorClient:
-        """
-        Get the shared MeteorClient instance, connecting and logging in if necessary.
-        """
-        # Create client if it doesn't exist or URL has changed
-        if self._client is None or self._endpoint != meteor_url:
-            try:
-                self._client = MeteorClient(meteor_url)
-                self._endpoint = meteor_url  # Store the endpoint URL
-                self._is_connected = False
-                self._is_logged_in = False
-            except Exception as e:
-                raise ConnectionError(f"Failed to create Meteor client: {e}")
-        
-        # Rest of the method stays the same
-        if not self._is_connected:
-            try:
-                self._client.connect()
-                self._is_connected = True
-            except Exception as e:
-                raise ConnectionError(f"Failed to connect to Meteor server at {self._endpoint}: {e}")
-            
-        if username and password and not self._is_logged_in:
-            try:
-                password_bytes = password.encode('utf-8') if isinstance(password, str) else password
-                self._client.login(username, password_bytes)
-                self._is_logged_in = True
-            except Exception as e:
-                raise ConnectionError(f"Failed to login to Meteor server at {self._endpoint}: {e}")
-        
-        return self._client
-    
-    async def call_method(self, method_name: str, params: Any, 
-                         meteor_url: str, 
-                         username: Optional[str] = None, 
-                         password: Optional[str] = None) -> Any:
-        """
-        Call a Meteor method using the shared client.
-        """
-        client = self.get_client(meteor_url, username, password)
-        
-        # Create a future that will be resolved by the callback
-        future = asyncio.Future()
-        
-        def callback(error, result):
-            if error:
-                future.set_exception(Exception(str(error)))
-            else:
-                future.set_result(result)
-        
-        # Make the call with the callback
-        client.call(method_name, [params], callback)
-        
-        # Wait for the callback to resolve the future
-        return await future
+    global _MeteorClient
+    if _MeteorClient is None:
+        from MeteorClient import MeteorClient
+        _MeteorClient = MeteorClient
+    return _MeteorClient
 
 
-def create_tool(
+async def _get_client(
+    meteor_url: str, username: Optional[str] = None, password: Optional[str] = None
+) -> "MeteorClient":
+    """
+    Get the pooled MeteorClient for this endpoint and user, connecting and logging in on first use.
+    """
+    key = (meteor_url, username or "")
+    client = _CLIENT_POOL.get(key)
+    if client is not None:
+        return client
+
+    async with _POOL_LOCK:
+        # Another coroutine may have created the client while we were waiting
+        client = _CLIENT_POOL.get(key)
+        if client is not None:
+            return client
+
+        client = _connect_client(meteor_url, username, password)
+        _CLIENT_POOL[key] = client
+        return client
+
+
+def _connect_client(
+    meteor_url: str, username: Optional[str] = None, password: Optional[str] = None
+) -> "MeteorClient":
+    """
+    Create a MeteorClient, connect it and log in if credentials are given.
+    """
+    try:
+        client = _meteor_client_class()(meteor_url)
+    except Exception as e:
+        raise ConnectionError(f"Failed to create Meteor client: {e}")
+
+    try:
+        client.connect()
+    except Exception as e:
+        raise ConnectionError(f"Failed to connect to Meteor server at {meteor_url}: {e}")
+
+    if username and password:
+        try:
+            password_bytes = password.encode('utf-8') if isinstance(password, str) else password
+            client.login(username, password_bytes)
+        except Exception as e:
+            client.close()
+            raise ConnectionError(f"Failed to login to Meteor server at {meteor_url}: {e}")
+
+    return client
+
+
+def _discard_client(client: "MeteorClient", meteor_url: str, username: Optional[str] = None) -> None:
+    """
+    Remove a client from the pool and close it, so the next call reconnects.
+    """
+    key = (meteor_url, username or "")
+    # Leave a replacement that another coroutine already created in place
+    if _CLIENT_POOL.get(key) is client:
+        del _CLIENT_POOL[key]
+    client.close()
+
+
+@atexit.register
+def _close_pool() -> None:
+    """
+    Close every pooled client when the interpreter exits.
+    """
+    while _CLIENT_POOL:
+        _, client = _CLIENT_POOL.popitem()
+        client.close()
+
+
+class MeteorMethodError(Exception):
+    """
+    An error returned by the Meteor server for a method call.
+    """
+
+
+class MeteorCallTimeout(Exception):
+    """
+    No reply to a Meteor method call arrived in time.
+
+    Deliberately not a TimeoutError (an OSError), so a slow method does not
+    get the shared client discarded.
+    """
+
+
+class MeteorSession:
+    """
+    Async context manager around a pooled Meteor client.
+
+    With keep_alive the pooled client stays open after the call unless the
+    connection itself failed; without it the session opens a dedicated
+    client and closes it on exit.
+    """
+
+    def __init__(self, meteor_url: str, username: Optional[str] = None,
+                 password: Optional[str] = None, keep_alive: bool = True):
+        self.meteor_url = meteor_url
+        self.username = username
+        self.password = password
+        self.keep_alive = keep_alive
+        self.client = None
+
+    async def __aenter__(self) -> "MeteorClient":
+        if self.keep_alive:
+            self.client = await _get_client(self.meteor_url, self.username, self.password)
+        else:
+            self.client = _connect_client(self.meteor_url, self.username, self.password)
+        return self.client
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if not self.keep_alive:
+            self.client.close()
+        # Only a broken socket is discarded: server errors and timeouts leave it usable, and
+        # a cancelled or timed out caller must not close the client other callers are waiting on
+        elif isinstance(exc, (OSError, ConnectionError)):
+            _discard_client(self.client, self.meteor_url, self.username)
+
+
+async def _call_method(method_name: str, params: Any,
+                       meteor_url: str,
+                       username: Optional[str] = None,
+                       password: Optional[str] = None,
+                       keep_alive: bool = True,
+                       timeout: Optional[float] = None) -> Any:
+    """
+    Call a Meteor method using the pooled client.
+    """
+    async with MeteorSession(meteor_url, username, password, keep_alive) as client:
+        return await _call_with_client(client, method_name, params, timeout)
+
+
+async def _call_with_client(client: "MeteorClient", method_name: str, params: Any,
+                            timeout: Optional[float] = None) -> Any:
+    """
+    Call a Meteor method on a connected client and wait for its result.
+    """
+    # The callback fires on the client's websocket thread: it fills the result slot
+    # and wakes the loop, which is cheaper than resolving a Future per call
+    loop = asyncio.get_running_loop()
+    done = asyncio.Event()
+    outcome: List[Any] = [None, None]  # [error, result]
+
+    def callback(error, result):
+        outcome[0] = error
+        outcome[1] = result
+        loop.call_soon_threadsafe(done.set)
+
+    # Make the call with the callback
+    client.call(method_name, [params], callback)
+
+    # Wait for the callback to fill the result slot
+    try:
+        await asyncio.wait_for(done.wait(), timeout)
+    except asyncio.TimeoutError:
+        raise MeteorCallTimeout(f"No reply to Meteor method '{method_name}' within {timeout} seconds")
+    error, result = outcome
+    if error:
+        raise MeteorMethodError(str(error))
+    return result
+
+
+def _build_description(
     method_name: str,
     json_schema: Optional[Dict[str, Any]] = None,
     description: Optional[str] = None,
-) -> Callable:
+) -> str:
     """
-    Factory function that creates a tool function for calling a Meteor method.
-    
-    Args:
-        method_name: The name of the Meteor method to call
-        json_schema: Optional JSON schema describing the expected input format
-        description: Optional description of what the tool does
-        
-    Returns:
-        A callable function that can be used as a LangGraph tool
+    Build the tool description for a Meteor method and its JSON schema.
     """
     # Default description if none provided
     if description is None:
@@ -118,8 +236,32 @@ def create_tool(
     
     # Include the full JSON schema in the tool description
     if json_schema:
-        description += f"\n\nJSON Schema: {json.dumps(json_schema, indent=4)}"
+        description += f"\n\nJSON Schema: {format_schema(json_schema)}"
         description += "\n\nWhen calling this tool, ensure your input is a valid JSON object that conforms to this schema."
+
+    return description
+
+
+def create_tool(
+    method_name: str,
+    json_schema: Optional[Dict[str, Any]] = None,
+    description: Optional[str] = None,
+) -> Callable:
+    """
+    Factory function that creates a tool function for calling a Meteor method.
+    
+    Args:
+        method_name: The name of the Meteor method to call
+        json_schema: Optional JSON schema describing the expected input format
+        description: Optional description of what the tool does
+        
+    Returns:
+        A callable function that can be used as a LangGraph tool
+    """
+    description = _build_description(method_name, json_schema, description)
+
+    # Compile the schema once so malformed queries are rejected before the network call
+    validate = fastjsonschema.compile(json_schema) if json_schema else None
     
     async def meteor_tool(
         query: str, *, config: Annotated[RunnableConfig, InjectedToolArg]
@@ -135,22 +277,34 @@ def create_tool(
             # Parse as JSON if JSON schema is provided
             if json_schema:
                 try:
-                    params = json.loads(query)
+                    params = _json_loads(query)
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
                 except json.JSONDecodeError:
-                    return f"Error: Invalid JSON in query: {query}"
+                    return _json_dumps({"error": f"Invalid JSON in query: {query}", "method": method_name})
+                try:
+                    validate(params)
+                except fastjsonschema.JsonSchemaException as e:
+                    return _json_dumps({
+                        "error": f"Query does not match the JSON schema: {e.message}",
+                        "method": method_name,
+                    })
             else:
                 params = {"query": query}
             
-            # Use the shared client manager to make the call
-            client_manager = MeteorClientManager()
-            result = await client_manager.call_method(
+            # Use the pooled client to make the call
+            result = await _call_method(
                 method_name, 
                 params, 
                 meteor_url,
                 username,
-                password
+                password,
+                configuration.meteor_keep_alive,
+                configuration.meteor_call_timeout,
             )
-            
+
+            # Serialize structured results once here instead of in the tool message pipeline
+            if isinstance(result, (dict, list)):
+                return _json_dumps(result)
             return result
                 
         except Exception as e:
@@ -158,7 +312,7 @@ def create_tool(
             print(f"Error calling Meteor method '{method_name}': {str(e)}")
             print(params)
             print("#" * 50)
-            return f"Error calling Meteor method '{method_name}': {str(e)}"
+            return _json_dumps({"error": str(e), "method": method_name})
     
     # Set metadata for the tool function
     meteor_tool.__name__ = f"meteor_{method_name.lower()}"
@@ -167,6 +321,9 @@ def create_tool(
     return meteor_tool
 
 
+_get_method_name = itemgetter("method_name")
+
+
 def create_tools(
     method_specs: List[Dict[str, Any]]
 ) -> List[Callable]:
@@ -182,16 +339,10 @@ def create_tools(
     Returns:
         List of tool functions
     """
-    tools = []
-    for spec in method_specs:
-        method_name = spec["method_name"]
-        json_schema = spec.get("json_schema")
-        description = spec.get("description")
-        
-        tool = create_tool(method_name, json_schema, description)
-        tools.append(tool)
-    
-    return tools
+    return [
+        create_tool(_get_method_name(spec), spec.get("json_schema"), spec.get("description"))
+        for spec in method_specs
+    ]
 
 
 # Create example tools
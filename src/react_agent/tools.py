@@ -16,14 +16,23 @@ from typing_extensions import Annotated
 from react_agent.configuration import Configuration
 
 # Updated import statements to use correct module paths
-from src.utilities.meteor_client_connection import MeteorClientConnection
+from src.utilities.meteor_client_connection import MeteorClientConnection, create_tools
 # from src.utilities.greeting import greeting
 # greeting("Jane Doe")
-from react_agent.meteor_tools import create_tools
 
-tool_client = MeteorClientConnection(Configuration.meteor_prefix)
+_tool_client: Optional[MeteorClientConnection] = None
 
-meteor_tools = tool_client.create_tools(
+
+def get_tool_client() -> MeteorClientConnection:
+    """Get the Meteor connection for the tools, creating it on first use."""
+    global _tool_client
+    if _tool_client is None:
+        _tool_client = MeteorClientConnection(Configuration().meteor_prefix)
+    return _tool_client
+
+
+meteor_tools = create_tools(
+    get_tool_client,
     [
         {
             "method_name": "TestCall",
@@ -75,9 +84,9 @@ TOOLS: List[Callable[..., Any]] = [search, finish, *meteor_tools]
 import asyncio
 
 if __name__ == "__main__":
-    print(Configuration.meteor_prefix)
-    print(tool_client.url)
-    print(tool_client.username)
+    print(Configuration().meteor_prefix)
+    print(get_tool_client().url)
+    print(get_tool_client().username)
     async def main():
         for tool in meteor_tools:
             print(f"Tool name: {tool.__name__}")
@@ -1,5 +1,7 @@
 """Utility & helper functions."""
 
+import functools
+
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage
@@ -17,9 +19,12 @@ def get_message_text(msg: BaseMessage) -> str:
         return "".join(txts).strip()
 
 
+@functools.lru_cache(maxsize=8)
 def load_chat_model(fully_specified_name: str) -> BaseChatModel:
     """Load a chat model from a fully specified name.
 
+    Models are cached per name so the provider client is only built once.
+
     Args:
         fully_specified_name (str): String in the format 'provider/model'.
     """
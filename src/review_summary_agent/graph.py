@@ -1,18 +1,42 @@
+from langchain_community.cache import SQLiteCache
 from langchain_openai import ChatOpenAI
 
+import io
 import operator
 from typing import Annotated, Any
 from typing_extensions import TypedDict
 from pydantic import BaseModel
 
 from langgraph.graph import END, StateGraph, START
-from langgraph.constants import Send
 
 import os
 from sqlalchemy import create_engine
 import pandas as pd
 
-model = ChatOpenAI(model="gpt-4.1", temperature=0)
+from review_summary_agent.sampling import SampleState, assign_buckets, get_samples
+
+# Serve repeated prompts (e.g. re-running the same art_artid) from a cache.
+# temperature=0 and the deterministic prompt construction keep the cache keys stable.
+# The caches are attached to these models only, so other agents in the process are unaffected.
+model = ChatOpenAI(
+    model="gpt-4.1",
+    temperature=0,
+    cache=SQLiteCache(os.environ.get("REVIEW_SUMMARY_CACHE_PATH", ".review_summary_cache.db")),
+)
+
+# With a Redis URL, near-identical review samples also hit via a semantic cache.
+# Only the per-bucket sample summaries use it: overall prompts of different products
+# share most of their text, so a semantic hit there could return another product's summary.
+sample_model = model
+redis_url = os.environ.get("REVIEW_SUMMARY_REDIS_URL")
+if redis_url:
+    from langchain_community.cache import RedisSemanticCache
+    from langchain_openai import OpenAIEmbeddings
+    sample_model = ChatOpenAI(
+        model="gpt-4.1",
+        temperature=0,
+        cache=RedisSemanticCache(redis_url=redis_url, embedding=OpenAIEmbeddings(), score_threshold=0.15),
+    )
 
 # Updated import path to use the correct module structure
 from src.utilities.meteor_client_connection import MeteorClientConnection
@@ -39,56 +63,29 @@ class OverallState(TypedDict):
     sample_summaries: Annotated[list[Summary], operator.add]
     overall_summary: Summary
 
-class SampleState(BaseModel):
-    sample: Any
-    sample_size: int
-    percentage: float
-
-
 def prepare_data(state: OverallState):
     
     reviews = state['reviews']
     
     df = pd.DataFrame(reviews)
-    df['full_text'] = df['ubi_headl'] + '\n\n ' + df['ubi_ltext']
+    df['full_text'] = df['ubi_headl'].str.cat(df['ubi_ltext'], sep='\n\n ', na_rep='')
+
+    # We sort the reviews into bad, mid and good buckets by rating
+    rating = df['ubi_bwges']
+    df['bucket'] = assign_buckets(rating)
 
     state['df'] = df
     return state
 
 
-def continue_to_sample_summaries(state: OverallState):
-    df = state['df']
-
-    # We create samples for good, mid and bad reviews
-    bad_filter = df['ubi_bwges'] < 4
-    mid_filter = (df['ubi_bwges'] >= 4) & (df['ubi_bwges'] <= 8)
-    good_filter = df['ubi_bwges'] > 8
-
-    filters = [bad_filter, mid_filter, good_filter]
-
-    target_sample_size = 100
-    random_state = 42
-
-    def get_sample_for_filter(filter) -> SampleState:
-        reviews = df[filter]
-        percentage = len(reviews) / len(df)
-        sample_size = min(len(reviews), target_sample_size)
-        sample = reviews.sample(sample_size, random_state=random_state)
-        return SampleState(sample=sample, sample_size=sample_size, percentage=percentage)
-
-    # Return a list of Send objects, one for each filter
-    return [Send("summarize_sample", get_sample_for_filter(filter)) for filter in filters]
-
-
-def summarize_sample(state: SampleState):
+def build_sample_prompt(state: SampleState) -> str:
     sample = state.sample
-    sample_size = state.sample_size
-    percentage = state.percentage
 
-    if sample_size == 0:
-        return None
-    
-    reviews_text = ''.join([f"Review {i+1}:\n{text}\n\n" for i, text in enumerate(sample['full_text'].tolist())])
+    # Sorted, stripped reviews give the same prompt for the same sample regardless of order or whitespace
+    buf = io.StringIO()
+    for i, text in enumerate(sorted(str(text).strip() for text in sample['full_text']), 1):
+        buf.write(f"Review {i}:\n{text}\n\n")
+    reviews_text = buf.getvalue()
 
     prompt = f"""
         You are a review summarizer. Your task is to summarize a sample of reviews.
@@ -112,9 +109,16 @@ def summarize_sample(state: SampleState):
         Reviews:
         {reviews_text}
         """
-    
-    response = model.with_structured_output(Summary).invoke(prompt)
-    return {"sample_summaries": [response]}
+    return prompt
+
+
+async def summarize_samples(state: OverallState):
+    # Summarize the non-empty buckets in a single batch of concurrent requests
+    samples = [sample for sample in get_samples(state['df']) if sample.sample_size > 0]
+    prompts = [build_sample_prompt(sample) for sample in samples]
+
+    responses = await sample_model.with_structured_output(Summary).abatch(prompts)
+    return {"sample_summaries": responses}
 
 
 async def summarize_overall(state: OverallState):
@@ -134,7 +138,7 @@ async def summarize_overall(state: OverallState):
         {sample_summaries}
     """
 
-    response = model.with_structured_output(Summary).invoke(prompt)
+    response = await model.with_structured_output(Summary).ainvoke(prompt)
     # Save the response to Meteor
     await save_to_meteor({"art_artid": state["art_artid"], "review_summary": response.dict()})
 
@@ -144,11 +148,11 @@ def create_graph():
     """Create the state graph for the review summary agent."""
     g = StateGraph(OverallState)
     g.add_node("prepare_data", prepare_data)
-    g.add_node("summarize_sample", summarize_sample)
+    g.add_node("summarize_samples", summarize_samples)
     g.add_node("summarize_overall", summarize_overall)
     g.add_edge(START, "prepare_data")
-    g.add_conditional_edges("prepare_data", continue_to_sample_summaries, ["summarize_sample"])
-    g.add_edge("summarize_sample", "summarize_overall")
+    g.add_edge("prepare_data", "summarize_samples")
+    g.add_edge("summarize_samples", "summarize_overall")
     g.add_edge("summarize_overall", END)
     graph = g.compile()
     graph.name = "Review Summary Agent"
@@ -0,0 +1,41 @@
+"""Sort reviews into rating buckets and draw the samples that get summarized."""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+# Rating buckets: bad (< 4), mid (4 to 8) and good (> 8)
+BUCKETS = ("bad", "mid", "good")
+
+
+class SampleState(BaseModel):
+    """The reviews drawn from one bucket and the bucket's share of all reviews."""
+
+    sample: Any
+    sample_size: int
+    percentage: float
+
+
+def assign_buckets(rating: pd.Series) -> np.ndarray:
+    """Map ratings to their bucket names; missing ratings get an empty bucket name."""
+    return np.select([rating < 4, rating <= 8, rating > 8], list(BUCKETS), default='')
+
+
+def get_samples(df: pd.DataFrame) -> list[SampleState]:
+    """Draw up to 100 random reviews per bucket, with each bucket's share of all reviews."""
+    target_sample_size = 100
+    random_state = 42
+
+    # Shuffle once and take the first rows of every bucket, instead of slicing and sampling per bucket
+    bucket_sizes = df['bucket'].value_counts()
+    shuffled = df.sample(frac=1, random_state=random_state)
+    samples = dict(tuple(shuffled.groupby('bucket').head(target_sample_size).groupby('bucket')))
+
+    def get_sample_for_bucket(bucket) -> SampleState:
+        sample = samples.get(bucket, df.iloc[:0])
+        percentage = bucket_sizes.get(bucket, 0) / len(df)
+        return SampleState(sample=sample, sample_size=len(sample), percentage=percentage)
+
+    return [get_sample_for_bucket(bucket) for bucket in BUCKETS]
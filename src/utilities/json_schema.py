@@ -0,0 +1,19 @@
+"""Render JSON schemas for Meteor tool descriptions."""
+
+import json
+from typing import Any, Dict
+
+# Pretty-printed schemas, keyed by their compact key-sorted serialization
+_FORMATTED_SCHEMAS: Dict[str, str] = {}
+
+
+def format_schema(json_schema: Dict[str, Any]) -> str:
+    """Pretty-print a JSON schema for a tool description, once per distinct schema.
+
+    Sorted keys give identical schema text across runs, which keeps LLM prompt prefixes cacheable.
+    """
+    key = json.dumps(json_schema, sort_keys=True)
+    text = _FORMATTED_SCHEMAS.get(key)
+    if text is None:
+        text = _FORMATTED_SCHEMAS[key] = json.dumps(json_schema, indent=4, sort_keys=True)
+    return text
@@ -1,17 +1,61 @@
 import asyncio
+import itertools
 import json
 import os
-from typing import Any, Callable, Dict, List, Union, Optional
+from typing import Any, Callable, Dict, List, Tuple, Union, Optional
 from typing_extensions import Annotated
 
+import fastjsonschema
 # from langchain_core.runnables import RunnableConfig
 # from langchain_core.tools import InjectedToolArg
 from MeteorClient import MeteorClient
 import socket
 
+from src.utilities.json_schema import format_schema
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+class PooledClient:
+    """
+    A MeteorClient together with its connection and login state.
+
+    The MeteorClient itself is only created when the client is first connected.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.client: Optional[MeteorClient] = None
+        self.is_connected = False
+        self.is_logged_in = False
+
+
+def _resolve(future: asyncio.Future, error: Any, result: Any) -> None:
+    """
+    Resolve a call's future from its DDP callback, unless the caller has given up on it.
+    """
+    if future.done():
+        return
+    if error:
+        future.set_exception(Exception(error))
+    else:
+        future.set_result(result)
+
+
+# Client pools shared by all connections to the same server and user, keyed by (url, username)
+_POOLS: Dict[Tuple[str, str], List[PooledClient]] = {}
+
+# Keep-alive tasks per pool, so shared pools are only pinged once
+_KEEPALIVE_TASKS: Dict[Tuple[str, str], asyncio.Task] = {}
+
+
 class MeteorClientConnection:
 
-    def __init__(self, meteor_prefix: str):
+    def __init__(self, meteor_prefix: str, pool_size: Optional[int] = None):
         self.url = "ws://127.0.0.1:3000/websocket" # os.environ.get(f"{meteor_prefix}_METEOR_URL", "fnord")
         self.username = "LangGraphAgent" # os.environ.get(f"{meteor_prefix}_METEOR_USERNAME", "snafu")
         self.password = "reasonablySafePassword1723" # os.environ.get(f"{meteor_prefix}_METEOR_PASSWORD", None)
@@ -21,96 +65,206 @@ class MeteorClientConnection:
             raise ValueError(f"{meteor_prefix}_METEOR_USERNAME not set")
         if self.password is None:
             raise ValueError(f"{meteor_prefix}_METEOR_PASSWORD not set")
-        self.client = MeteorClient(self.url)
-        self.is_connected = False
-        self.is_logged_in = False
+        self._password_bytes = self.password.encode('utf-8') if isinstance(self.password, str) else self.password
+        self.pool_key = (self.url, self.username)
+        if self.pool_key in _POOLS:
+            # The pool is shared, so it keeps the size it was created with
+            if pool_size and pool_size != len(_POOLS[self.pool_key]):
+                raise ValueError(
+                    f"Meteor client pool for {self.username}@{self.url} already has "
+                    f"{len(_POOLS[self.pool_key])} clients, cannot use pool_size={pool_size}"
+                )
+        else:
+            size = pool_size or int(os.environ.get("METEOR_POOL_SIZE", 4))
+            _POOLS[self.pool_key] = [PooledClient(self.url) for _ in range(size)]
+        self.pool = _POOLS[self.pool_key]
+        self.pool_size = len(self.pool)
+        # Spread calls over the pooled websockets round-robin
+        self._next_client = itertools.cycle(self.pool)
+        # Calls queued for the next flush, per event loop
+        self._pending: Dict[asyncio.AbstractEventLoop, List[Tuple[str, List[Any], asyncio.Future]]] = {}
+        self.batch_delay = float(os.environ.get("METEOR_BATCH_DELAY", 0))
+        self.keepalive_interval = float(os.environ.get("METEOR_KEEPALIVE_INTERVAL", 25))
         print('MeteorClientConnection', self.url, self.username, self.password)
 
-    def ensure_connection(self) -> None:
+    def ensure_connection(self, pooled: PooledClient) -> None:
         """
-        Get the shared MeteorClient instance, connecting and logging in if necessary.
+        Connect and log in a pooled MeteorClient if necessary.
         """
-        if self.client is None:
-            self.client = MeteorClient(self.url)
-            self.is_connected = False
-            self.is_logged_in = False
-        if not self.is_connected:
+        if pooled.client is None:
+            pooled.client = MeteorClient(pooled.url)
+            pooled.is_connected = False
+            pooled.is_logged_in = False
+        if not pooled.is_connected:
             try:
-                self.client.connect()
-                self.is_connected = True
+                pooled.client.connect()
+                pooled.is_connected = True
             except socket.error as e:
                 raise ConnectionError(f"Failed to connect to Meteor server at {self.url}: {e}")
-        if not self.is_logged_in:
+        if not pooled.is_logged_in:
             try:
-                self.client.login(self.username, self.password.encode('utf-8'))
-                self.is_logged_in = True
+                pooled.client.login(self.username, self._password_bytes)
+                pooled.is_logged_in = True
             except socket.error as e:
                 raise ConnectionError(f"Failed to login to Meteor server at {self.url}: {e}")
     
     async def call(self, method_name: str, params: List[Any]) -> Any:
         """
-        Async wrapper for calling a Meteor method using the shared client connection.
+        Async wrapper for calling a Meteor method using the next client of the shared pool.
         """
-        self.ensure_connection()
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         future = loop.create_future()
+        self._ensure_keepalive()
 
-        def callback(error, result):
-            if error:
-                loop.call_soon_threadsafe(future.set_exception, Exception(error))
+        # Queue the call; the first call of a batch schedules the flush
+        pending = self._pending.setdefault(loop, [])
+        pending.append((method_name, params, future))
+        if len(pending) == 1:
+            if self.batch_delay > 0:
+                loop.call_later(self.batch_delay, self._flush, loop)
             else:
-                loop.call_soon_threadsafe(future.set_result, result)
+                loop.call_soon(self._flush, loop)
 
-        self.client.call(method_name, params, callback)
         return await future
 
-    def create_tool(
-        self,
-        method_name: str,
-        json_schema: Dict[str, Any],
-        instruction: Optional[str] = None,) -> Callable:
+    def _ensure_keepalive(self) -> None:
+        """
+        Start the keep-alive task for this connection's pool if it is not running.
+        """
+        if self.keepalive_interval <= 0:
+            return
+        task = _KEEPALIVE_TASKS.get(self.pool_key)
+        # A task left on a previous (possibly closed) event loop never finishes, so restart it here
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            _KEEPALIVE_TASKS[self.pool_key] = asyncio.create_task(self._keepalive())
+
+    async def _keepalive(self) -> None:
         """
-        Factory function that creates a tool function for calling a Meteor method.
+        Ping the connected pooled clients periodically so idle websockets stay open.
 
-        Args:
-            method_name (str): The name of the Meteor method to call.
-            json_schema (Dict[str, Any]): The JSON schema for the method's parameters.
-            instruction (Optional[str]): Optional instruction for the tool using llm.
+        A client whose ping fails is closed and dropped, so the next call connects a fresh one:
+        the old socket is closed or already reconnected by the DDP client and cannot connect again.
+        """
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            for pooled in self.pool:
+                if not pooled.is_connected:
+                    continue
+                try:
+                    # A DDP protocol ping: the server answers with a pong and no method is invoked
+                    pooled.client.ddp_client.send({"msg": "ping"})
+                except Exception:
+                    client, pooled.client = pooled.client, None
+                    pooled.is_connected = False
+                    pooled.is_logged_in = False
+                    try:
+                        client.close()
+                    except Exception:
+                        pass
 
-        Returns:
-            Callable: A callable function with metadata that can be used as a LangGraph tool.
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Dispatch all queued calls without waiting in between; DDP multiplexes them over the websockets.
         """
+        pending = self._pending.pop(loop, [])
+        ready = set()
+        for method_name, params, future in pending:
+            # The caller may have been cancelled while the call was queued
+            if future.done():
+                continue
+            pooled = next(self._next_client)
 
-        doc = f"""
-            {json_schema.get("description", "")}
-            {instruction or ""}
-            Call with a dictionary of parameters that match the JSON schema:
-            {json.dumps(json_schema, indent=4)}
-         """
-        
-        async def tool_function(params_json: str) -> Any:
-            try:
-                params = json.loads(params_json)
-            except json.JSONDecodeError as e:
-                return f"Invalid JSON: {e}"
+            def callback(error, result, future=future):
+                loop.call_soon_threadsafe(_resolve, future, error, result)
+
+            # Any failure must reach the future, since it is no longer queued anywhere
             try:
-                result = await self.call(method_name, [params])
+                # Connect and log in each client at most once per batch
+                if id(pooled) not in ready:
+                    self.ensure_connection(pooled)
+                    ready.add(id(pooled))
+                pooled.client.call(method_name, params, callback)
             except Exception as e:
-                return f"Error calling {method_name}: {e}"
-            return result
+                future.set_exception(e)
 
-        tool_function.__name__ = method_name
-        tool_function.__doc__ = doc
-        return tool_function
+    def create_tool(
+        self,
+        method_name: str,
+        json_schema: Dict[str, Any],
+        instruction: Optional[str] = None,) -> Callable:
+        """
+        Create a tool function that calls a Meteor method over this connection.
+        """
+        return create_tool(lambda: self, method_name, json_schema, instruction)
 
     def create_tools(
         self,
         tool_definitions: List[Dict[str, Any]]
     ) -> List[Callable]:
-        return [
-            self.create_tool(
-                method_name=tool["method_name"],
-                json_schema=tool.get("json_schema", {}),
-                instruction=tool.get("instruction")
-            ) for tool in tool_definitions
-        ]
+        return create_tools(lambda: self, tool_definitions)
+
+
+def create_tool(
+    client_factory: Callable[[], MeteorClientConnection],
+    method_name: str,
+    json_schema: Dict[str, Any],
+    instruction: Optional[str] = None,) -> Callable:
+    """
+    Factory function that creates a tool function for calling a Meteor method.
+
+    Args:
+        client_factory (Callable[[], MeteorClientConnection]): Returns the connection to call the method on.
+            It is only invoked when the tool is called, so the connection can be created lazily.
+        method_name (str): The name of the Meteor method to call.
+        json_schema (Dict[str, Any]): The JSON schema for the method's parameters.
+        instruction (Optional[str]): Optional instruction for the tool using llm.
+
+    Returns:
+        Callable: A callable function with metadata that can be used as a LangGraph tool.
+    """
+
+    schema_text = format_schema(json_schema)
+    doc = f"""
+        {json_schema.get("description", "")}
+        {instruction or ""}
+        Call with a dictionary of parameters that match the JSON schema:
+        {schema_text}
+     """
+
+    # Compile the schema once so malformed params are rejected without a round trip to the server
+    validate = fastjsonschema.compile(json_schema) if json_schema else None
+    
+    async def tool_function(params_json: str) -> Any:
+        try:
+            params = _json_loads(params_json)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        except json.JSONDecodeError as e:
+            return f"Invalid JSON: {e}"
+        if validate is not None:
+            try:
+                validate(params)
+            except fastjsonschema.JsonSchemaException as e:
+                return f"Schema error: {e.message}"
+        try:
+            result = await client_factory().call(method_name, [params])
+        except Exception as e:
+            return f"Error calling {method_name}: {e}"
+        return result
+
+    tool_function.__name__ = method_name
+    tool_function.__doc__ = doc
+    return tool_function
+
+
+def create_tools(
+    client_factory: Callable[[], MeteorClientConnection],
+    tool_definitions: List[Dict[str, Any]]
+) -> List[Callable]:
+    return [
+        create_tool(
+            client_factory,
+            method_name=tool["method_name"],
+            json_schema=tool.get("json_schema", {}),
+            instruction=tool.get("instruction")
+        ) for tool in tool_definitions
+    ]
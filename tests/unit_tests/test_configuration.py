@@ -3,3 +3,16 @@ from react_agent.configuration import Configuration
 
 def test_configuration_empty() -> None:
     Configuration.from_runnable_config({})
+
+
+def test_configuration_meteor_prefix(monkeypatch) -> None:
+    monkeypatch.setenv("TEST_PREFIX_METEOR_URL", "ws://meteor.test/websocket")
+    monkeypatch.setenv("TEST_PREFIX_METEOR_USERNAME", "agent")
+
+    configuration = Configuration.from_runnable_config(
+        {"configurable": {"meteor_prefix": "TEST_PREFIX", "meteor_user_name": "explicit"}}
+    )
+
+    assert configuration.meteor_url == "ws://meteor.test/websocket"
+    assert configuration.meteor_user_name == "explicit"
+    assert configuration.meteor_user_password == Configuration().meteor_user_password
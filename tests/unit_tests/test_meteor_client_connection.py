@@ -0,0 +1,125 @@
+import asyncio
+import types
+
+import pytest
+
+from utilities import meteor_client_connection
+from utilities.meteor_client_connection import MeteorClientConnection
+
+
+class StubMeteorClient:
+    instances: list = []
+    connect_error: Exception | None = None
+
+    def __init__(self, url):
+        self.url = url
+        self.calls = []
+        self.connects = 0
+        self.closed = False
+        self.ddp_client = types.SimpleNamespace(send=lambda msg: None)
+        StubMeteorClient.instances.append(self)
+
+    def connect(self):
+        self.connects += 1
+        if StubMeteorClient.connect_error is not None:
+            raise StubMeteorClient.connect_error
+
+    def login(self, username, password):
+        pass
+
+    def call(self, method, params, callback):
+        self.calls.append((method, params))
+        callback(None, {"method": method, "params": params})
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def connection(monkeypatch):
+    StubMeteorClient.instances = []
+    StubMeteorClient.connect_error = None
+    monkeypatch.setattr(meteor_client_connection, "MeteorClient", StubMeteorClient)
+    monkeypatch.setattr(meteor_client_connection, "_POOLS", {})
+    monkeypatch.setattr(meteor_client_connection, "_KEEPALIVE_TASKS", {})
+    monkeypatch.setenv("METEOR_KEEPALIVE_INTERVAL", "0")
+    monkeypatch.setenv("METEOR_BATCH_DELAY", "0.01")
+    return MeteorClientConnection("TEST", pool_size=2)
+
+
+def test_batch_resolves_every_call(connection) -> None:
+    async def run():
+        return await asyncio.gather(*(connection.call("echo", [i]) for i in range(5)))
+
+    results = asyncio.run(run())
+
+    assert [result["params"] for result in results] == [[i] for i in range(5)]
+    # Both pooled clients are used, and each is connected once for the whole batch
+    assert len(StubMeteorClient.instances) == 2
+    assert [client.connects for client in StubMeteorClient.instances] == [1, 1]
+
+
+def test_connect_failure_fails_every_call(connection) -> None:
+    StubMeteorClient.connect_error = ValueError("bad url")
+
+    async def run():
+        return await asyncio.wait_for(
+            asyncio.gather(*(connection.call("echo", [i]) for i in range(3)), return_exceptions=True),
+            timeout=1,
+        )
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_cancelled_call_is_not_dispatched(connection) -> None:
+    async def run():
+        cancelled = asyncio.create_task(connection.call("cancelled", []))
+        kept = asyncio.create_task(connection.call("kept", []))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        return cancelled, await kept
+
+    cancelled, kept = asyncio.run(run())
+
+    assert kept["method"] == "kept"
+    assert cancelled.cancelled()
+    dispatched = [method for client in StubMeteorClient.instances for method, _ in client.calls]
+    assert dispatched == ["kept"]
+
+
+def test_keepalive_sends_protocol_ping(connection) -> None:
+    sent = []
+
+    def send_on_closed_socket(msg):
+        raise OSError("socket closed")
+
+    async def run():
+        await asyncio.gather(connection.call("echo", [0]), connection.call("echo", [1]))
+        healthy, broken = StubMeteorClient.instances
+        healthy.ddp_client.send = sent.append
+        broken.ddp_client.send = send_on_closed_socket
+
+        connection.keepalive_interval = 0.01
+        task = asyncio.create_task(connection._keepalive())
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+    asyncio.run(run())
+    broken = StubMeteorClient.instances[1]
+
+    assert sent and all(msg == {"msg": "ping"} for msg in sent)
+    assert [pooled.is_connected for pooled in connection.pool] == [True, False]
+    # The broken client is replaced on the next call instead of reconnecting the dead one
+    assert broken.closed and connection.pool[1].client is None
+    # The ping never goes through a Meteor method call
+    assert [method for client in StubMeteorClient.instances for method, _ in client.calls] == ["echo", "echo"]
+
+
+def test_shared_pool_keeps_its_size(connection) -> None:
+    assert MeteorClientConnection("OTHER").pool is connection.pool
+    assert MeteorClientConnection("OTHER").pool_size == 2
+
+    with pytest.raises(ValueError):
+        MeteorClientConnection("OTHER", pool_size=3)
@@ -0,0 +1,64 @@
+import asyncio
+import functools
+import json
+
+import pytest
+
+from react_agent import meteor_tools
+from react_agent.meteor_tools import create_tool
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"testNumber": {"type": "number"}},
+    "required": ["testNumber"],
+}
+
+
+@pytest.mark.parametrize(
+    "query, message",
+    [
+        ("not json", "Invalid JSON in query"),
+        ('{"testString": "Hello"}', "Query does not match the JSON schema"),
+    ],
+)
+def test_invalid_query_returns_json_error(query, message) -> None:
+    tool = create_tool("TestCall", SCHEMA)
+
+    error = json.loads(asyncio.run(tool(query, config={})))
+
+    assert error["method"] == "TestCall"
+    assert error["error"].startswith(message)
+
+
+def test_timeout_keeps_the_shared_client(monkeypatch) -> None:
+    class SlowClient:
+        closed = False
+
+        def connect(self):
+            pass
+
+        def login(self, username, password):
+            pass
+
+        def call(self, method, params, callback):
+            # Only "fast" ever gets a reply
+            if method == "fast":
+                asyncio.get_running_loop().call_later(0.2, callback, None, "done")
+
+        def close(self):
+            self.closed = True
+
+    client = SlowClient()
+    monkeypatch.setattr(meteor_tools, "_MeteorClient", lambda url: client)
+    monkeypatch.setattr(meteor_tools, "_CLIENT_POOL", {})
+
+    async def run():
+        call = functools.partial(meteor_tools._call_method, params={}, meteor_url="ws://meteor.test", timeout=0.1)
+        fast = asyncio.create_task(call("fast", timeout=1))
+        with pytest.raises(meteor_tools.MeteorCallTimeout):
+            await call("slow")
+        return await fast
+
+    assert asyncio.run(run()) == "done"
+    assert not client.closed
+    assert list(meteor_tools._CLIENT_POOL.values()) == [client]
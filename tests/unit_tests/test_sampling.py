@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from review_summary_agent.sampling import BUCKETS, assign_buckets, get_samples
+
+
+def make_reviews(ratings) -> pd.DataFrame:
+    df = pd.DataFrame({"ubi_bwges": ratings})
+    df["full_text"] = [f"review {i}" for i in range(len(df))]
+    df["bucket"] = assign_buckets(df["ubi_bwges"])
+    return df
+
+
+def test_assign_buckets() -> None:
+    rating = pd.Series([1, 3.9, 4, 8, 8.5, 10, np.nan])
+
+    assert list(assign_buckets(rating)) == ["bad", "bad", "mid", "mid", "good", "good", ""]
+
+
+def test_get_samples_caps_each_bucket() -> None:
+    df = make_reviews([1] * 150 + [5] * 30 + [10] * 20)
+
+    samples = get_samples(df)
+
+    assert [sample.sample_size for sample in samples] == [100, 30, 20]
+    assert [sample.percentage for sample in samples] == [0.75, 0.15, 0.1]
+    for bucket, sample in zip(BUCKETS, samples):
+        assert (sample.sample["bucket"] == bucket).all()
+    # The capped bucket is a sample, not the first rows
+    assert sorted(samples[0].sample.index) != list(range(100))
+
+
+def test_get_samples_empty_bucket() -> None:
+    df = make_reviews([1, 2, 10])
+
+    samples = get_samples(df)
+
+    assert [sample.sample_size for sample in samples] == [2, 0, 1]
+    assert samples[1].percentage == 0
+    assert samples[1].sample.empty
+
+
+def test_get_samples_skips_missing_ratings() -> None:
+    df = make_reviews([1, np.nan, 5, np.nan])
+
+    samples = get_samples(df)
+
+    assert [sample.sample_size for sample in samples] == [1, 1, 0]
+    # Unrated reviews still count towards the total the percentages refer to
+    assert [sample.percentage for sample in samples] == [0.25, 0.25, 0.0]